@@ -8,6 +8,10 @@ Hybrid Approach:
 
 Usage:
     python test_skill.py <skill-path> [--output-dir <dir>] [--no-ai]
+    python test_skill.py <skills-dir> [--output-dir <dir>]
+
+When <skills-dir> has no SKILL.md of its own, every child directory that
+does is validated in parallel (structural checks only).
 
 This script performs comprehensive validation of Claude Skills based on
 skill-creator specifications and generates a detailed Markdown test report.
@@ -16,18 +20,33 @@ skill-creator specifications and generates a detailed Markdown test report.
 import argparse
 import io
 import json
+import mmap
 import os
 import re
+import shutil
 import subprocess
 import sys
+import time
+import traceback
+import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
-# Fix Windows encoding issue
+# Fix Windows encoding issue (only wrap streams that aren't already UTF-8)
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
+    if (getattr(sys.stdout, "encoding", None) or "").lower() not in ("utf-8", "utf8"):
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer, encoding="utf-8", errors="replace", write_through=True
+        )
+    if (getattr(sys.stderr, "encoding", None) or "").lower() not in ("utf-8", "utf8"):
+        sys.stderr = io.TextIOWrapper(
+            sys.stderr.buffer, encoding="utf-8", errors="replace", write_through=True
+        )
 
 
 # =============================================================================
@@ -39,30 +58,71 @@ MAX_SKILL_NAME_LENGTH = 64
 SKILL_NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
 MAX_SKILL_BODY_LINES = 500
 MAX_REFERENCE_LINES_FOR_TOC = 100
-REQUIRED_YAML_FIELDS = {"name", "description"}
-ALLOWED_YAML_FIELDS = REQUIRED_YAML_FIELDS
+REQUIRED_YAML_FIELDS = ("name", "description")  # Checked in this order
+ALLOWED_YAML_FIELDS = frozenset(REQUIRED_YAML_FIELDS)
+
+# Score deducted per result of each status (out of 100)
+STATUS_PENALTIES = {"critical": 20, "warning": 10, "suggestion": 5}
+
+# Statuses listed as issues in AI metadata
+REPORTABLE_STATUSES = frozenset({"critical", "warning", "suggestion"})
 
 # Template documentation patterns to detect
-TEMPLATE_PATTERNS = [
-    r"##?\s*When\s+to\s+Use\s+(?:This\s+)?Skill",
-    r"##?\s*Structuring\s+(?:This\s+)?Skill",
-    r"##?\s*Bundled\s+Resources?",
-    r"##?\s*Anatomy\s+of\s+a\s+Skill",
-    r"##?\s*Progressive\s+Disclosure",
-    r"##?\s*What\s+(?:to\s+)?Not\s+Include",
-    r"##?\s*Skill\s+Naming",
-]
-
-# Unnecessary file patterns
-UNNECESSARY_FILE_PATTERNS = [
-    r"^readme",
-    r"^changelog",
-    r"^install",
-    r"^license",
-    r"^contributing",
-    r"^authors",
-    r"^upgrade",
-]
+TEMPLATE_HEADING_PREFIX = r"##?\s*"
+TEMPLATE_HEADINGS = (
+    r"When\s+to\s+Use\s+(?:This\s+)?Skill",
+    r"Structuring\s+(?:This\s+)?Skill",
+    r"Bundled\s+Resources?",
+    r"Anatomy\s+of\s+a\s+Skill",
+    r"Progressive\s+Disclosure",
+    r"What\s+(?:to\s+)?Not\s+Include",
+    r"Skill\s+Naming",
+)
+# Full pattern text, used to label findings
+TEMPLATE_PATTERNS = tuple(TEMPLATE_HEADING_PREFIX + heading for heading in TEMPLATE_HEADINGS)
+
+# All template patterns as one scanner: the shared "#" prefix is matched once
+# and each heading is a named group, so a single pass reports every pattern
+TEMPLATE_PATTERNS_RE = re.compile(
+    TEMPLATE_HEADING_PREFIX
+    + "(?:"
+    + "|".join(f"(?P<t{i}>{heading})" for i, heading in enumerate(TEMPLATE_HEADINGS))
+    + ")",
+    re.IGNORECASE,
+)
+
+# Unnecessary file name prefixes, matched case-insensitively against the
+# lowercased file name with a single str.startswith call
+UNNECESSARY_FILE_PREFIXES = (
+    "readme",
+    "changelog",
+    "install",
+    "license",
+    "contributing",
+    "authors",
+    "upgrade",
+)
+
+# Markdown links, matched within a single line
+MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]\n]+)\]\(([^)\n]+)\)")
+
+# Markdown links to other .md files (used for reference nesting checks)
+REFERENCE_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+\.md)\)")
+
+# Non-imperative "How to ..." headings. Searches are anchored on the preceding
+# newline rather than ^/MULTILINE so they can skip ahead to each "\n#"; the
+# unanchored form is only matched at offset 0.
+HOW_TO_HEADING = r"##+[^\S\n]+How[^\S\n]+to[^\S\n]+"
+HOW_TO_HEADING_PATTERN = re.compile(r"\n" + HOW_TO_HEADING, re.IGNORECASE)
+HOW_TO_HEADING_START = re.compile(HOW_TO_HEADING, re.IGNORECASE)
+
+# Case-insensitive substring probes. re.ASCII keeps the case folding identical
+# to a str.lower() + `in` test while avoiding the lowercased copy.
+WHEN_TO_USE_PATTERN = re.compile(r"when to use", re.IGNORECASE | re.ASCII)
+TRIGGER_KEYWORDS_PATTERN = re.compile(
+    r"when|use|trigger|scenario|context", re.IGNORECASE | re.ASCII
+)
+TOC_PATTERN = re.compile(r"toc|contents", re.IGNORECASE | re.ASCII)
 
 # Script extensions and their checkers
 SCRIPT_CHECKERS = {
@@ -93,151 +153,363 @@ class Colors:
     DIM = "\033[2m"
 
 
+class ConsoleBuffer:
+    """Collects terminal output and writes it to stdout in a single call."""
+
+    def __init__(self) -> None:
+        self._buf: List[str] = []
+
+    def write(self, msg: str = "") -> None:
+        """Queue a plain line."""
+        self._buf.append(f"{msg}\n")
+
+    def success(self, msg: str) -> None:
+        """Queue success message."""
+        self._buf.append(f"{Colors.OKGREEN}✓{Colors.ENDC} {msg}\n")
+
+    def error(self, msg: str) -> None:
+        """Queue error message."""
+        self._buf.append(f"{Colors.FAIL}✗{Colors.ENDC} {msg}\n")
+
+    def warning(self, msg: str) -> None:
+        """Queue warning message."""
+        self._buf.append(f"{Colors.WARNING}⚠{Colors.ENDC} {msg}\n")
+
+    def info(self, msg: str) -> None:
+        """Queue info message."""
+        self._buf.append(f"{Colors.OKCYAN}ℹ{Colors.ENDC} {msg}\n")
+
+    def extend(self, other: "ConsoleBuffer") -> None:
+        """Queue everything from another buffer, emptying it."""
+        self._buf.extend(other._buf)
+        other._buf.clear()
+
+    def drain(self) -> str:
+        """Return all queued output and clear the buffer."""
+        text = "".join(self._buf)
+        self._buf.clear()
+        return text
+
+    def flush(self) -> None:
+        """Write all queued output at once."""
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            sys.stdout.flush()
+            self._buf.clear()
+
+
+console = ConsoleBuffer()
+
+
 def print_success(msg: str) -> None:
     """Print success message."""
-    print(f"{Colors.OKGREEN}✓{Colors.ENDC} {msg}")
+    console.success(msg)
 
 
 def print_error(msg: str) -> None:
     """Print error message."""
-    print(f"{Colors.FAIL}✗{Colors.ENDC} {msg}")
+    console.error(msg)
 
 
 def print_warning(msg: str) -> None:
     """Print warning message."""
-    print(f"{Colors.WARNING}⚠{Colors.ENDC} {msg}")
+    console.warning(msg)
 
 
 def print_info(msg: str) -> None:
     """Print info message."""
-    print(f"{Colors.OKCYAN}ℹ{Colors.ENDC} {msg}")
+    console.info(msg)
 
 
 def print_phase_header(phase: int, total: int, title: str) -> None:
-    """Print phase header."""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}Phase {phase}/{total}: {title}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*60}{Colors.ENDC}\n")
+    """Print phase header, flushing output from the previous phase."""
+    console.flush()
+    console.write(f"\n{Colors.BOLD}{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}Phase {phase}/{total}: {title}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}{Colors.HEADER}{'='*60}{Colors.ENDC}\n")
 
 
 # =============================================================================
 # VALIDATION RESULT
 # =============================================================================
 
-class ValidationResult:
+class ValidationResult(NamedTuple):
     """Represents a single validation check result."""
 
-    def __init__(
-        self,
-        category: str,
-        status: str,
-        message: str,
-        details: str = "",
-        line_ref: Optional[int] = None,
-        suggestion: str = "",
-    ):
-        self.category = category  # Module name
-        self.status = status  # "critical", "warning", "suggestion", "pass", "info"
-        self.message = message
-        self.details = details
-        self.line_ref = line_ref
-        self.suggestion = suggestion
+    category: str  # Module name
+    status: str  # "critical", "warning", "suggestion", "pass", "info"
+    message: str
+    details: str = ""
+    line_ref: Optional[int] = None
+    suggestion: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "category": self.category,
-            "status": self.status,
-            "message": self.message,
-            "details": self.details,
-            "line_ref": self.line_ref,
-            "suggestion": self.suggestion,
-        }
+        return self._asdict()
 
 
 # =============================================================================
 # CONTENT EXTRACTORS
 # =============================================================================
 
+def read_utf8(path: Path) -> str:
+    """Read a UTF-8 text file with universal newlines.
+
+    Decodes straight from a read-only mapping of the file so the raw bytes
+    are never copied into an intermediate buffer.
+    """
+    content = ""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8")
+
+    # Binary reads skip universal-newline translation
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
 class SkillContentExtractor:
     """Extracts and parses content from SKILL.md files."""
 
-    def __init__(self, skill_md: Path):
+    def __init__(self, skill_md: Path) -> None:
         self.skill_md = skill_md
         self.content = ""
-        self.yaml_content = ""
         self.yaml_lines: List[str] = []
-        self.body_lines: List[str] = []
-        self.all_lines: List[str] = []
+        self._body_start = -1  # Offset of the first body line, -1 if none
+        self._yaml_fields: Dict[str, str] = {}
         self._load_content()
 
     def _load_content(self) -> None:
         """Load and parse SKILL.md content."""
         try:
-            with open(self.skill_md, "r", encoding="utf-8") as f:
-                self.content = f.read()
-                self.all_lines = self.content.split("\n")
-        except Exception as e:
+            self.content = read_utf8(self.skill_md)
+        except Exception:
             return
 
         # Find YAML boundaries
-        yaml_start = -1
-        yaml_end = -1
-
-        for i, line in enumerate(self.all_lines):
-            stripped = line.strip()
-            if stripped == "---":
-                if yaml_start == -1:
-                    yaml_start = i
-                elif yaml_end == -1:
-                    yaml_end = i
-                    break
-
-        if yaml_start >= 0:
-            self.yaml_lines = self.all_lines[yaml_start + 1:yaml_end]
-            self.yaml_content = "\n".join(self.yaml_lines).strip()
-            self.body_lines = self.all_lines[yaml_end + 1:]
+        yaml_start, yaml_start_end = self._find_delimiter(0)
+        if yaml_start < 0:
+            return
+        yaml_end, yaml_end_end = self._find_delimiter(yaml_start_end + 1)
+
+        if yaml_end < 0:
+            # Unterminated frontmatter: every line after the opening
+            # delimiter except the last one
+            last_newline = self.content.rfind("\n", yaml_start_end + 1)
+            if last_newline >= 0:
+                self.yaml_lines = self.content[yaml_start_end + 1:last_newline].split("\n")
+            self._body_start = 0
+        else:
+            if yaml_end > yaml_start_end + 1:
+                self.yaml_lines = self.content[yaml_start_end + 1:yaml_end - 1].split("\n")
+            if yaml_end_end < len(self.content):
+                self._body_start = yaml_end_end + 1
+        self._parse_yaml_fields()
+
+    def _find_delimiter(self, pos: int) -> Tuple[int, int]:
+        """Find the next '---' line at or after pos as (line start, line end) offsets."""
+        content = self.content
+        idx = content.find("---", pos)
+        while idx >= 0:
+            line_start = content.rfind("\n", 0, idx) + 1
+            line_end = content.find("\n", idx)
+            if line_end < 0:
+                line_end = len(content)
+            if line_start >= pos and content[line_start:line_end].strip() == "---":
+                return line_start, line_end
+            idx = content.find("---", line_end)
+        return -1, -1
+
+    @cached_property
+    def body(self) -> str:
+        """Body text (everything after the frontmatter), sliced only when first needed."""
+        return self.content[self._body_start:] if self._body_start >= 0 else ""
+
+    @cached_property
+    def yaml_content(self) -> str:
+        """Frontmatter text without the delimiters."""
+        return "\n".join(self.yaml_lines).strip()
+
+    @cached_property
+    def all_lines(self) -> List[str]:
+        """All lines of SKILL.md, split only when first needed."""
+        return self.content.split("\n")
+
+    def _parse_yaml_fields(self) -> None:
+        """Parse top-level 'key: value' pairs from the YAML lines once."""
+        for line in self.yaml_lines:
+            colon_pos = line.find(":")
+            if colon_pos < 0:
+                continue
+            key = line[:colon_pos]
+            if key in self._yaml_fields:
+                continue
+            value = line[colon_pos + 1:].strip()
+            # Remove quotes if present
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1]
+            elif value.startswith("'") and value.endswith("'"):
+                value = value[1:-1]
+            self._yaml_fields[key] = value
 
     def get_yaml_field(self, field_name: str) -> Optional[str]:
         """Extract a YAML field value."""
-        for line in self.yaml_lines:
-            if line.startswith(f"{field_name}:"):
-                value = line.split(":", 1)[1].strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                return value
-        return None
+        return self._yaml_fields.get(field_name)
+
+    def get_yaml_dict(self) -> Dict[str, str]:
+        """Return every top-level 'key: value' pair (keys unstripped, first wins)."""
+        return self._yaml_fields
+
+    @cached_property
+    def _content_lower(self) -> str:
+        """Lowercased content, built once for case-insensitive lookups."""
+        return self.content.lower()
+
+    @cached_property
+    def body_lines(self) -> List[str]:
+        """Body lines, split only when first needed."""
+        return self.body.split("\n") if self._body_start >= 0 else []
+
+    @cached_property
+    def _body_text_lower(self) -> str:
+        """Lowercased body text, built once for substring checks."""
+        return self.body.lower()
 
     def find_line_number(self, pattern: str) -> Optional[int]:
         """Find the line number containing a pattern."""
-        for i, line in enumerate(self.all_lines, 1):
-            if pattern.lower() in line.lower():
-                return i
-        return None
+        pattern_lower = pattern.lower()
+        if "\n" in pattern_lower:
+            return None
+        # Let str.find scan the whole buffer, then map the offset to a line
+        idx = self._content_lower.find(pattern_lower)
+        if idx < 0:
+            return None
+        return self._content_lower.count("\n", 0, idx) + 1
 
     def extract_markdown_links(self) -> List[Tuple[str, str, int]]:
         """Extract all markdown links [(text, url, line_num)]."""
-        links = []
-        link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-
-        for i, line in enumerate(self.body_lines, 1):
-            for match in link_pattern.finditer(line):
-                text = match.group(1)
-                url = match.group(2)
-                links.append((text, url, i))
+        links: List[Tuple[str, str, int]] = []
+        if self._body_start < 0:
+            return links
+        content = self.content
+        line_num = 1
+        last_pos = self._body_start
+
+        # One sweep over the body in place; line numbers are advanced by
+        # counting newlines between consecutive matches.
+        for match in MARKDOWN_LINK_PATTERN.finditer(content, self._body_start):
+            line_num += content.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            links.append((match.group(1), match.group(2), line_num))
         return links
 
+    @cached_property
+    def _template_matches(self) -> Tuple[str, ...]:
+        """TEMPLATE_PATTERNS found in the content, scanned once per extractor."""
+        found = {int(m.lastgroup[1:]) for m in TEMPLATE_PATTERNS_RE.finditer(self.content)}
+        return tuple(TEMPLATE_PATTERNS[i] for i in sorted(found))
+
+    def find_template_patterns(self) -> List[str]:
+        """Return the TEMPLATE_PATTERNS that occur in the content."""
+        return list(self._template_matches)
+
+    def body_prefix(self, limit: int) -> str:
+        """First `limit` characters of the body, without copying the rest of it."""
+        if self._body_start < 0:
+            return ""
+        return self.content[self._body_start:self._body_start + limit]
+
     def count_body_lines(self) -> int:
         """Count lines in the body (excluding YAML)."""
-        return len(self.body_lines)
+        if self._body_start < 0:
+            return 0
+        return self.content.count("\n", self._body_start) + 1
 
     def has_pattern(self, pattern: str) -> bool:
-        """Check if body contains a pattern."""
-        body_text = "\n".join(self.body_lines).lower()
-        return pattern.lower() in body_text
+        """Check if body contains a pattern (case-insensitive)."""
+        return pattern.lower() in self._body_text_lower
+
+    def scan_body(self) -> Dict[str, Any]:
+        """Run the content structure checks against the loaded content.
+
+        TODO markers and the Resources section are looked for in the whole
+        file; "When to Use" and "How to" headings only in the body.
+        how_to_lineno is the body line of the first "How to" heading.
+        """
+        return dict(self._body_scan)
+
+    @cached_property
+    def _body_scan(self) -> Dict[str, Any]:
+        """Results for scan_body(), computed once per extractor."""
+        content = self.content
+        # Literal probes go through str.count / `in`, which use CPython's
+        # fastsearch directly on the decoded buffer.
+        result: Dict[str, Any] = {
+            "todo_count": content.count("TODO"),
+            "has_when_to_use": (
+                self._body_start >= 0
+                and WHEN_TO_USE_PATTERN.search(content, self._body_start) is not None
+            ),
+            "how_to_lineno": None,
+            "has_resources_section": "## Resources" in content or "### scripts/" in content,
+        }
+
+        body_start = self._body_start
+        if body_start == 0 and HOW_TO_HEADING_START.match(content):
+            result["how_to_lineno"] = 1
+        elif body_start >= 0:
+            # Every other body line starts right after a newline; a non-zero
+            # body_start is itself preceded by one
+            match = HOW_TO_HEADING_PATTERN.search(content, max(body_start - 1, 0))
+            if match:
+                # Newlines up to and including the one ending the previous line
+                result["how_to_lineno"] = content.count("\n", body_start, match.start() + 1) + 1
+        return result
+
+
+# Each skill is validated once per run, so only a few extractors need to stay
+# alive; a small bound keeps batch workers from pinning every SKILL.md read.
+@lru_cache(maxsize=8)
+def _load_extractor(skill_md: str, mtime_ns: int, size: int) -> SkillContentExtractor:
+    """Build an extractor; mtime_ns and size are part of the cache key only."""
+    return SkillContentExtractor(Path(skill_md))
+
+
+def get_extractor(skill_md: Path) -> SkillContentExtractor:
+    """Return a shared extractor for skill_md, reloaded if the file changed.
+
+    The cache is keyed on the file's stat signature rather than a hash of its
+    content, so a hit costs one stat() and no read. The size guards against
+    rewrites that land within the filesystem's mtime granularity.
+    """
+    st = os.stat(skill_md)
+    return _load_extractor(str(skill_md), st.st_mtime_ns, st.st_size)
+
+
+def scan_files(directory: Path, suffix: str = "") -> List[Path]:
+    """List regular files in directory (non-recursive) whose name ends with suffix.
+
+    suffix must be lowercase; like Path.glob, it matches case-insensitively
+    on platforms with case-insensitive paths (os.path.normcase). Raises
+    OSError if the directory cannot be listed.
+    """
+    normcase = os.path.normcase
+    with os.scandir(directory) as entries:
+        return [Path(e.path) for e in entries if normcase(e.name).endswith(suffix) and e.is_file()]
+
+
+@lru_cache(maxsize=None)
+def tool_available(*probe: str) -> bool:
+    """Check once per process that a tool is on PATH and its probe command succeeds."""
+    if shutil.which(probe[0]) is None:
+        return False
+    try:
+        subprocess.run(probe, capture_output=True, timeout=2, check=True)
+    except (subprocess.CalledProcessError, OSError, subprocess.TimeoutExpired):
+        return False
+    return True
 
 
 # =============================================================================
@@ -247,10 +519,59 @@ class SkillContentExtractor:
 class StructuralValidator:
     """Performs Python-based structural validation checks."""
 
-    def __init__(self, skill_path: Path):
+    def __init__(self, skill_path: Path) -> None:
         self.skill_path = skill_path
         self.skill_name = skill_path.name
         self.results: List[ValidationResult] = []
+        self._extractor: Optional[SkillContentExtractor] = None
+        self._root_entries: Dict[str, os.DirEntry] = {}
+
+    def _scan_skill_root(self) -> None:
+        """List the skill directory once; later checks look entries up by name."""
+        try:
+            with os.scandir(self.skill_path) as entries:
+                self._root_entries = {e.name: e for e in entries}
+        except OSError:
+            self._root_entries = {}
+
+    def _has_file(self, name: str) -> bool:
+        """Check whether the skill directory contains a regular file.
+
+        Names missing from the scan are checked on disk as well, so that a
+        case-insensitive filesystem still finds e.g. skill.md as SKILL.md.
+        """
+        entry = self._root_entries.get(name)
+        if entry is None:
+            return (self.skill_path / name).is_file()
+        return entry.is_file()
+
+    def _has_dir(self, name: str) -> bool:
+        """Check whether the skill directory contains a subdirectory (see _has_file)."""
+        entry = self._root_entries.get(name)
+        if entry is None:
+            return (self.skill_path / name).is_dir()
+        return entry.is_dir()
+
+    def _list_files(self, category: str, directory: Path, suffix: str = "") -> List[Path]:
+        """scan_files() for a skill subdirectory, reporting it if it can't be listed."""
+        try:
+            return scan_files(directory, suffix)
+        except OSError as e:
+            self.add_result(
+                category,
+                "warning",
+                f"{directory.name}/ could not be listed",
+                str(e),
+                suggestion=f"Make {directory.name}/ readable",
+            )
+            print_warning(f"{directory.name}/ could not be listed")
+            return []
+
+    def _get_extractor(self) -> SkillContentExtractor:
+        """Return the SKILL.md extractor, loading it on first use."""
+        if self._extractor is None:
+            self._extractor = get_extractor(self.skill_path / "SKILL.md")
+        return self._extractor
 
     def add_result(
         self,
@@ -268,6 +589,7 @@ class StructuralValidator:
 
     def validate_all(self) -> None:
         """Run all structural validation checks."""
+        self._scan_skill_root()
         self._validate_naming()
         self._validate_structure()
         self._validate_yaml()
@@ -281,7 +603,7 @@ class StructuralValidator:
 
     def _validate_naming(self) -> None:
         """Validate skill naming conventions."""
-        print(f"{Colors.BOLD}[1/7] Naming Convention Validation{Colors.ENDC}")
+        console.write(f"{Colors.BOLD}[1/7] Naming Convention Validation{Colors.ENDC}")
 
         # Check name format (lowercase, digits, hyphens only)
         if not SKILL_NAME_PATTERN.match(self.skill_name):
@@ -310,9 +632,8 @@ class StructuralValidator:
             print_success(f"Name length OK: {len(self.skill_name)} chars")
 
         # Check directory name matches YAML name
-        skill_md = self.skill_path / "SKILL.md"
-        if skill_md.exists():
-            extractor = SkillContentExtractor(skill_md)
+        if self._has_file("SKILL.md"):
+            extractor = self._get_extractor()
             yaml_name = extractor.get_yaml_field("name")
             if yaml_name and yaml_name != self.skill_name:
                 self.add_result(
@@ -332,15 +653,10 @@ class StructuralValidator:
 
     def _validate_structure(self) -> None:
         """Validate skill directory structure."""
-        print(f"\n{Colors.BOLD}[2/7] Structure Validation{Colors.ENDC}")
-
-        skill_md = self.skill_path / "SKILL.md"
-        scripts_dir = self.skill_path / "scripts"
-        refs_dir = self.skill_path / "references"
-        assets_dir = self.skill_path / "assets"
+        console.write(f"\n{Colors.BOLD}[2/7] Structure Validation{Colors.ENDC}")
 
         # Check SKILL.md exists
-        if not skill_md.exists():
+        if not self._has_file("SKILL.md"):
             self.add_result(
                 "structure",
                 "critical",
@@ -355,15 +671,11 @@ class StructuralValidator:
 
         # Check for unnecessary files
         unnecessary_files: List[str] = []
-        for f in self.skill_path.iterdir():
-            if f.is_file() and f.name != "SKILL.md":
+        for name, entry in self._root_entries.items():
+            if name != "SKILL.md" and entry.is_file():
                 # Check against unnecessary file patterns
-                fname_lower = f.name.lower()
-                if any(
-                    re.match(pattern, fname_lower)
-                    for pattern in UNNECESSARY_FILE_PATTERNS
-                ):
-                    unnecessary_files.append(f.name)
+                if name.lower().startswith(UNNECESSARY_FILE_PREFIXES):
+                    unnecessary_files.append(name)
 
         if unnecessary_files:
             self.add_result(
@@ -378,13 +690,9 @@ class StructuralValidator:
             print_success("No unnecessary files")
 
         # Report resource directories
-        found_dirs = []
-        if scripts_dir.exists():
-            found_dirs.append("scripts/")
-        if refs_dir.exists():
-            found_dirs.append("references/")
-        if assets_dir.exists():
-            found_dirs.append("assets/")
+        found_dirs = [
+            f"{name}/" for name in ("scripts", "references", "assets") if self._has_dir(name)
+        ]
 
         if found_dirs:
             print_success(f"Resource directories: {', '.join(found_dirs)}")
@@ -395,13 +703,12 @@ class StructuralValidator:
 
     def _validate_yaml(self) -> None:
         """Validate YAML frontmatter."""
-        print(f"\n{Colors.BOLD}[3/7] YAML Frontmatter Validation{Colors.ENDC}")
+        console.write(f"\n{Colors.BOLD}[3/7] YAML Frontmatter Validation{Colors.ENDC}")
 
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
+        if not self._has_file("SKILL.md"):
             return
 
-        extractor = SkillContentExtractor(skill_md)
+        extractor = self._get_extractor()
 
         # Check if YAML exists
         if not extractor.yaml_lines:
@@ -417,13 +724,10 @@ class StructuralValidator:
 
         print_success("YAML frontmatter found")
 
-        # Check for extra fields
-        extra_fields: Set[str] = set()
-        for line in extractor.yaml_lines:
-            if ":" in line:
-                field = line.split(":", 1)[0].strip()
-                if field and field not in ALLOWED_YAML_FIELDS:
-                    extra_fields.add(field)
+        # Check for extra fields (reusing the keys parsed at load time)
+        data = extractor.get_yaml_dict()
+        extra_fields: Set[str] = {key.strip() for key in data} - ALLOWED_YAML_FIELDS
+        extra_fields.discard("")
 
         if extra_fields:
             self.add_result(
@@ -439,7 +743,7 @@ class StructuralValidator:
 
         # Check required fields
         for field in REQUIRED_YAML_FIELDS:
-            value = extractor.get_yaml_field(field)
+            value = data.get(field)
             if not value:
                 self.add_result(
                     "yaml",
@@ -453,13 +757,13 @@ class StructuralValidator:
                 print_success(f"Field found: {field}")
 
         # Validate name field matches directory
-        yaml_name = extractor.get_yaml_field("name")
+        yaml_name = data.get("name")
         if yaml_name and yaml_name != self.skill_name:
             # Already reported in naming check
             pass
 
         # Validate description quality
-        description = extractor.get_yaml_field("description")
+        description = data.get("description")
         if description:
             self._validate_description_quality(description)
 
@@ -467,11 +771,8 @@ class StructuralValidator:
         self, description: str
     ) -> None:
         """Validate the quality of the description field."""
-        desc_lower = description.lower()
-
         # Check if description mentions "when to use"
-        trigger_keywords = ["when", "use", "trigger", "scenario", "context"]
-        has_trigger_info = any(keyword in desc_lower for keyword in trigger_keywords)
+        has_trigger_info = TRIGGER_KEYWORDS_PATTERN.search(description) is not None
 
         if not has_trigger_info:
             self.add_result(
@@ -502,13 +803,12 @@ class StructuralValidator:
 
     def _validate_content_structure(self) -> None:
         """Validate content structure."""
-        print(f"\n{Colors.BOLD}[4/7] Content Structure Validation{Colors.ENDC}")
+        console.write(f"\n{Colors.BOLD}[4/7] Content Structure Validation{Colors.ENDC}")
 
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
+        if not self._has_file("SKILL.md"):
             return
 
-        extractor = SkillContentExtractor(skill_md)
+        extractor = self._get_extractor()
 
         # Check line count
         body_count = extractor.count_body_lines()
@@ -524,8 +824,10 @@ class StructuralValidator:
         else:
             print_success(f"Body length OK: {body_count} lines")
 
+        scan = extractor.scan_body()
+
         # Check for TODO items
-        todo_count = extractor.content.count("TODO")
+        todo_count = scan["todo_count"]
         if todo_count > 0:
             self.add_result(
                 "content",
@@ -539,20 +841,19 @@ class StructuralValidator:
             print_success("No TODO items")
 
         # Check for template documentation sections
-        for pattern in TEMPLATE_PATTERNS:
-            if re.search(pattern, extractor.content, re.IGNORECASE):
-                self.add_result(
-                    "content",
-                    "suggestion",
-                    f"Template documentation found: {pattern}",
-                    "Remove skill-creator template sections from production skills",
-                    suggestion="Delete template documentation sections",
-                )
-                print_info(f"Template found: {pattern}")
+        for pattern in extractor.find_template_patterns():
+            self.add_result(
+                "content",
+                "suggestion",
+                f"Template documentation found: {pattern}",
+                "Remove skill-creator template sections from production skills",
+                suggestion="Delete template documentation sections",
+            )
+            print_info(f"Template found: {pattern}")
 
         # Check for "When to Use" section in body (should be in description)
-        if extractor.has_pattern("When to Use") or extractor.has_pattern("When to Use This"):
-            line_num = extractor.find_line_number("When to Use")
+        # ("When to Use This" is covered by the shorter needle)
+        if scan["has_when_to_use"]:
             self.add_result(
                 "content",
                 "suggestion",
@@ -563,20 +864,18 @@ class StructuralValidator:
             print_info("'When to Use' in body (should be in description)")
 
         # Check for imperative language in headings
-        for i, line in enumerate(extractor.body_lines, 1):
-            if re.match(r"^##+\s+How\s+to\s+", line, re.IGNORECASE):
-                self.add_result(
-                    "content",
-                    "suggestion",
-                    "Found 'How to' heading (non-imperative)",
-                    "Use imperative form: e.g., 'Create X' instead of 'How to Create X'",
-                    suggestion="Change to imperative/infinitive form",
-                )
-                print_info("Found 'How to' heading")
-                break
+        if scan["how_to_lineno"] is not None:
+            self.add_result(
+                "content",
+                "suggestion",
+                "Found 'How to' heading (non-imperative)",
+                "Use imperative form: e.g., 'Create X' instead of 'How to Create X'",
+                suggestion="Change to imperative/infinitive form",
+            )
+            print_info("Found 'How to' heading")
 
         # Check for "Resources" section that just describes structure
-        if "## Resources" in extractor.content or "### scripts/" in extractor.content:
+        if scan["has_resources_section"]:
             self.add_result(
                 "content",
                 "suggestion",
@@ -592,71 +891,99 @@ class StructuralValidator:
 
     def _validate_references(self) -> None:
         """Validate references directory."""
-        print(f"\n{Colors.BOLD}[5/7] References Validation{Colors.ENDC}")
+        console.write(f"\n{Colors.BOLD}[5/7] References Validation{Colors.ENDC}")
 
         refs_dir = self.skill_path / "references"
 
-        if not refs_dir.exists():
+        if not self._has_dir("references"):
             print_info("No references/ directory")
             return
 
         print_success("references/ directory found")
 
         # Check each reference file
-        ref_files = list(refs_dir.glob("*.md"))
+        ref_files = self._scan_ref_files(refs_dir)
         if not ref_files:
             print_info("No .md files in references/")
             return
 
-        print(f"Checking {len(ref_files)} reference file(s)...")
+        console.write(f"Checking {len(ref_files)} reference file(s)...")
 
-        for ref_file in ref_files:
+        for ref_file, (line_count, has_toc, _) in ref_files.items():
             # Check line count and TOC
-            with open(ref_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                line_count = len(lines)
-
-            if line_count > MAX_REFERENCE_LINES_FOR_TOC:
-                # Check for TOC
-                has_toc = any("toc" in line.lower() or "contents" in line.lower() for line in lines[:20])
-                if not has_toc:
-                    self.add_result(
-                        "references",
-                        "suggestion",
-                        f"{ref_file.name}: {line_count} lines (no TOC)",
-                        f"Files >{MAX_REFERENCE_LINES_FOR_TOC} lines should have a table of contents",
-                        suggestion=f"Add TOC to {ref_file.name}",
-                    )
-                    print_info(f"{ref_file.name}: No TOC ({line_count} lines)")
+            if line_count > MAX_REFERENCE_LINES_FOR_TOC and not has_toc:
+                self.add_result(
+                    "references",
+                    "suggestion",
+                    f"{ref_file.name}: {line_count} lines (no TOC)",
+                    f"Files >{MAX_REFERENCE_LINES_FOR_TOC} lines should have a table of contents",
+                    suggestion=f"Add TOC to {ref_file.name}",
+                )
+                print_info(f"{ref_file.name}: No TOC ({line_count} lines)")
 
         # Check for deep nesting (references linking to references)
-        self._check_deep_nesting(refs_dir)
+        self._check_deep_nesting(ref_files)
 
-    def _check_deep_nesting(self, refs_dir: Path) -> None:
-        """Check for deep nesting in references."""
-        # For each reference file, check if it links to other references
-        for ref_file in refs_dir.glob("*.md"):
+    def _scan_ref_files(self, refs_dir: Path) -> Dict[Path, Tuple[int, bool, Optional[str]]]:
+        """Summarize each reference file: {path: (line_count, has_toc, nested_link)}.
+
+        Each file is read once and only its summary is kept, so memory stays
+        bounded by the largest file rather than the whole references/ tree.
+        Unreadable files are reported and left out.
+        """
+        scanned: Dict[Path, Tuple[int, bool, Optional[str]]] = {}
+        for ref_file in self._list_files("references", refs_dir, ".md"):
             try:
-                with open(ref_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Check for markdown links to other .md files
-                link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+\.md)\)")
-                for match in link_pattern.finditer(content):
-                    target = match.group(2)
-                    # Skip if it's a self-reference or external link
-                    if not target.startswith("http") and ref_file.name not in target:
-                        self.add_result(
-                            "references",
-                            "warning",
-                            f"{ref_file.name} links to another reference: {target}",
-                            "References should only be one level deep from SKILL.md",
-                            suggestion="Move the linked content directly into SKILL.md or restructure",
-                        )
-                        print_warning(f"Deep nesting: {ref_file.name} -> {target}")
-                        break
-            except Exception:
-                pass
+                content = read_utf8(ref_file)
+            except (OSError, UnicodeDecodeError) as e:
+                self.add_result(
+                    "references",
+                    "warning",
+                    f"{ref_file.name}: could not be read",
+                    str(e),
+                    suggestion=f"Make {ref_file.name} a readable UTF-8 file",
+                )
+                print_warning(f"{ref_file.name}: could not be read")
+                continue
+
+            line_count = content.count("\n")
+            if content and not content.endswith("\n"):
+                line_count += 1
+
+            # A TOC is a "toc"/"contents" mention within the first 20 lines
+            head_end = -1
+            for _ in range(20):
+                head_end = content.find("\n", head_end + 1)
+                if head_end < 0:
+                    head_end = len(content)
+                    break
+            has_toc = TOC_PATTERN.search(content, 0, head_end) is not None
+
+            # First markdown link to another .md file, if any
+            nested_link = None
+            for match in REFERENCE_LINK_PATTERN.finditer(content):
+                target = match.group(2)
+                # Skip if it's a self-reference or external link
+                if not target.startswith("http") and ref_file.name not in target:
+                    nested_link = target
+                    break
+
+            scanned[ref_file] = (line_count, has_toc, nested_link)
+        return scanned
+
+    def _check_deep_nesting(self, ref_files: Dict[Path, Tuple[int, bool, Optional[str]]]) -> None:
+        """Check for deep nesting in references."""
+        # Report each reference file that links to another reference
+        for ref_file, (_, _, target) in ref_files.items():
+            if target is not None:
+                self.add_result(
+                    "references",
+                    "warning",
+                    f"{ref_file.name} links to another reference: {target}",
+                    "References should only be one level deep from SKILL.md",
+                    suggestion="Move the linked content directly into SKILL.md or restructure",
+                )
+                print_warning(f"Deep nesting: {ref_file.name} -> {target}")
 
     # -------------------------------------------------------------------------
     # Script Testing
@@ -664,62 +991,109 @@ class StructuralValidator:
 
     def _test_scripts(self) -> None:
         """Test executable scripts."""
-        print(f"\n{Colors.BOLD}[6/7] Script Testing{Colors.ENDC}")
+        console.write(f"\n{Colors.BOLD}[6/7] Script Testing{Colors.ENDC}")
 
         scripts_dir = self.skill_path / "scripts"
-        if not scripts_dir.exists():
+        if not self._has_dir("scripts"):
             print_info("No scripts/ directory")
             return
 
         print_success("scripts/ directory found")
 
-        # Find all supported scripts
-        all_scripts: List[Path] = []
-        for ext in SCRIPT_CHECKERS.keys():
-            all_scripts.extend(scripts_dir.glob(f"*{ext}"))
+        # Find all supported scripts in one directory scan, grouped by extension
+        by_ext: Dict[str, List[Path]] = {ext: [] for ext in SCRIPT_CHECKERS}
+        for script in self._list_files("scripts", scripts_dir):
+            ext = os.path.normcase(script.suffix)
+            if ext in by_ext:
+                by_ext[ext].append(script)
+        all_scripts = [script for group in by_ext.values() for script in group]
 
         if not all_scripts:
             print_info("No scripts found")
             return
 
-        print(f"Testing {len(all_scripts)} script(s)...")
-
-        for script in all_scripts:
-            checker = SCRIPT_CHECKERS.get(script.suffix)
-            if checker == "python":
-                self._test_python_script(script)
-            elif checker == "bash":
-                self._test_bash_script(script)
-            elif checker in ("javascript", "typescript"):
-                self._test_js_script(script)
-            elif checker == "powershell":
-                self._test_powershell_script(script)
-            elif checker == "batch":
-                self._test_batch_script(script)
-
-    def _test_python_script(self, script: Path) -> None:
+        console.write(f"Testing {len(all_scripts)} script(s)...")
+
+        # Syntax-check every Python script in one pass before reporting
+        python_errors = self._check_python_syntax(by_ext[".py"])
+
+        # Subprocess checks mostly wait on child processes, so run them on a
+        # thread pool. Each script collects its own output and results, which
+        # are merged on this thread in discovery order.
+        max_workers = min(8, os.cpu_count() or 1, len(all_scripts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._test_script, script, python_errors.get(script))
+                for script in all_scripts
+            ]
+            for future in futures:
+                out, results = future.result()
+                console.extend(out)
+                self.results.extend(results)
+
+    def _test_script(
+        self, script: Path, python_error: Optional[str]
+    ) -> Tuple[ConsoleBuffer, List[ValidationResult]]:
+        """Test a single script, collecting its output and results."""
+        out = ConsoleBuffer()
+        results: List[ValidationResult] = []
+        checker = SCRIPT_CHECKERS.get(os.path.normcase(script.suffix))
+        if checker == "python":
+            self._test_python_script(script, python_error, out, results)
+        elif checker == "bash":
+            self._test_bash_script(script, out, results)
+        elif checker in ("javascript", "typescript"):
+            self._test_js_script(script, out, results)
+        elif checker == "powershell":
+            self._test_powershell_script(script, out, results)
+        elif checker == "batch":
+            self._test_batch_script(script, out, results)
+        return out, results
+
+    def _check_python_syntax(self, scripts: List[Path]) -> Dict[Path, str]:
+        """Compile Python scripts in-process, returning error text per failing script.
+
+        Uses the same compile() call as py_compile, without a subprocess per
+        script and without writing .pyc files. SyntaxWarnings are silenced as
+        they were in the py_compile child process; this runs on the main thread
+        before any worker threads start, so the filter change is not racy.
+        Sources too large or deeply nested to compile count as syntax errors.
+        """
+        errors: Dict[Path, str] = {}
+        for script in scripts:
+            try:
+                source = script.read_bytes()
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    compile(source, str(script), "exec", dont_inherit=True)
+            except (SyntaxError, ValueError, MemoryError, RecursionError) as e:
+                errors[script] = "".join(traceback.format_exception_only(type(e), e)).strip()
+            except OSError as e:
+                errors[script] = str(e)
+        return errors
+
+    def _test_python_script(
+        self,
+        script: Path,
+        syntax_error: Optional[str],
+        out: ConsoleBuffer,
+        results: List[ValidationResult],
+    ) -> None:
         """Test a Python script."""
-        print(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
-
-        # Syntax check
-        result = subprocess.run(
-            [sys.executable, "-m", "py_compile", str(script)],
-            capture_output=True,
-            text=True,
-        )
+        out.write(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
 
-        if result.returncode != 0:
-            self.add_result(
+        if syntax_error is not None:
+            results.append(ValidationResult(
                 "scripts",
                 "critical",
                 f"{script.name}: Syntax error",
-                result.stderr.strip(),
+                syntax_error,
                 suggestion="Fix Python syntax errors",
-            )
-            print_error(f"  Syntax error")
+            ))
+            out.error(f"  Syntax error")
             return
 
-        print_success(f"  {script.name}: Syntax OK")
+        out.success(f"  {script.name}: Syntax OK")
 
         # Check for main block
         try:
@@ -727,7 +1101,7 @@ class StructuralValidator:
                 content = f.read()
 
             if '__name__ == "__main__"' in content:
-                print_info(f"  {script.name}: Has main block")
+                out.info(f"  {script.name}: Has main block")
 
                 # Try --help
                 try:
@@ -738,17 +1112,19 @@ class StructuralValidator:
                         timeout=5,
                     )
                     if help_result.returncode == 0 or "usage:" in help_result.stdout.lower():
-                        print_success(f"  {script.name}: Supports --help")
+                        out.success(f"  {script.name}: Supports --help")
                     else:
-                        print_info(f"  {script.name}: No --help support")
+                        out.info(f"  {script.name}: No --help support")
                 except (subprocess.TimeoutExpired, FileNotFoundError):
                     pass
         except Exception as e:
-            print_warning(f"  Runtime check skipped: {e}")
+            out.warning(f"  Runtime check skipped: {e}")
 
-    def _test_bash_script(self, script: Path) -> None:
+    def _test_bash_script(
+        self, script: Path, out: ConsoleBuffer, results: List[ValidationResult]
+    ) -> None:
         """Test a Bash script."""
-        print(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
+        out.write(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
 
         # Syntax check
         result = subprocess.run(
@@ -758,17 +1134,17 @@ class StructuralValidator:
         )
 
         if result.returncode != 0:
-            self.add_result(
+            results.append(ValidationResult(
                 "scripts",
                 "critical",
                 f"{script.name}: Syntax error",
                 result.stderr.strip(),
                 suggestion="Fix Bash syntax errors",
-            )
-            print_error(f"  Syntax error")
+            ))
+            out.error(f"  Syntax error")
             return
 
-        print_success(f"  {script.name}: Syntax OK")
+        out.success(f"  {script.name}: Syntax OK")
 
         # Check shebang
         try:
@@ -776,33 +1152,28 @@ class StructuralValidator:
                 first_line = f.readline()
 
             if first_line.startswith("#!"):
-                print_success(f"  {script.name}: {first_line.strip()}")
+                out.success(f"  {script.name}: {first_line.strip()}")
             else:
-                self.add_result(
+                results.append(ValidationResult(
                     "scripts",
                     "warning",
                     f"{script.name}: No shebang",
                     "Add #!/bin/bash or #!/usr/bin/env bash",
                     suggestion="Add shebang line",
-                )
-                print_warning(f"  No shebang")
+                ))
+                out.warning(f"  No shebang")
         except Exception:
             pass
 
-    def _test_js_script(self, script: Path) -> None:
+    def _test_js_script(
+        self, script: Path, out: ConsoleBuffer, results: List[ValidationResult]
+    ) -> None:
         """Test a JavaScript/TypeScript script."""
-        print(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
+        out.write(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
 
         # Check if node is available
-        try:
-            subprocess.run(
-                ["node", "--version"],
-                capture_output=True,
-                timeout=2,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            print_info(f"  {script.name}: Node not available, skipping syntax check")
+        if not tool_available("node", "--version"):
+            out.info(f"  {script.name}: Node not available, skipping syntax check")
             return
 
         # Syntax check with node
@@ -813,31 +1184,26 @@ class StructuralValidator:
         )
 
         if result.returncode != 0:
-            self.add_result(
+            results.append(ValidationResult(
                 "scripts",
                 "critical",
                 f"{script.name}: Syntax error",
                 result.stderr.strip(),
                 suggestion="Fix JavaScript/TypeScript syntax errors",
-            )
-            print_error(f"  Syntax error")
+            ))
+            out.error(f"  Syntax error")
         else:
-            print_success(f"  {script.name}: Syntax OK")
+            out.success(f"  {script.name}: Syntax OK")
 
-    def _test_powershell_script(self, script: Path) -> None:
+    def _test_powershell_script(
+        self, script: Path, out: ConsoleBuffer, results: List[ValidationResult]
+    ) -> None:
         """Test a PowerShell script."""
-        print(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
+        out.write(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
 
         # Check if pwsh is available
-        try:
-            subprocess.run(
-                ["pwsh", "-Version"],
-                capture_output=True,
-                timeout=2,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            print_info(f"  {script.name}: PowerShell not available, skipping check")
+        if not tool_available("pwsh", "-Version"):
+            out.info(f"  {script.name}: PowerShell not available, skipping check")
             return
 
         # Syntax check
@@ -848,20 +1214,22 @@ class StructuralValidator:
         )
 
         if result.returncode != 0:
-            self.add_result(
+            results.append(ValidationResult(
                 "scripts",
                 "critical",
                 f"{script.name}: Syntax error",
                 result.stderr.strip(),
                 suggestion="Fix PowerShell syntax errors",
-            )
-            print_error(f"  Syntax error")
+            ))
+            out.error(f"  Syntax error")
         else:
-            print_success(f"  {script.name}: Syntax OK")
+            out.success(f"  {script.name}: Syntax OK")
 
-    def _test_batch_script(self, script: Path) -> None:
+    def _test_batch_script(
+        self, script: Path, out: ConsoleBuffer, results: List[ValidationResult]
+    ) -> None:
         """Test a Batch script."""
-        print(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
+        out.write(f"\n  {Colors.OKCYAN}Testing: {script.name}{Colors.ENDC}")
 
         # Batch scripts are hard to validate syntactically
         # Just check for basic issues
@@ -871,11 +1239,11 @@ class StructuralValidator:
 
             # Check for @echo off (good practice)
             if "@echo off" in content or "@echo ON" in content:
-                print_success(f"  {script.name}: Has @echo directive")
+                out.success(f"  {script.name}: Has @echo directive")
             else:
-                print_info(f"  {script.name}: No @echo off")
+                out.info(f"  {script.name}: No @echo off")
 
-            print_info(f"  {script.name}: Manual review recommended")
+            out.info(f"  {script.name}: Manual review recommended")
         except Exception:
             pass
 
@@ -891,7 +1259,7 @@ class StructuralValidator:
 class AISemanticAnalyzer:
     """Performs AI-based semantic analysis on skill content."""
 
-    def __init__(self, skill_path: Path):
+    def __init__(self, skill_path: Path) -> None:
         self.skill_path = skill_path
         self.skill_name = skill_path.name
         self.results: List[ValidationResult] = []
@@ -911,7 +1279,7 @@ class AISemanticAnalyzer:
 
     def analyze_all(self) -> None:
         """Run all semantic analysis checks."""
-        print(f"\n{Colors.BOLD}[7/7] AI Semantic Analysis{Colors.ENDC}")
+        console.write(f"\n{Colors.BOLD}[7/7] AI Semantic Analysis{Colors.ENDC}")
         print_info("AI semantic analysis runs in main session")
         print_info("(Use --ai-metadata to generate metadata for main session analysis)")
 
@@ -925,23 +1293,17 @@ class AISemanticAnalyzer:
 # =============================================================================
 
 class SkillScorer:
-    """Calculates quality score for a skill."""
+    """Calculates quality score for a skill from its per-status result counts."""
 
-    def __init__(self, results: List[ValidationResult]):
-        self.results = results
+    def __init__(self, status_counts: Dict[str, int]) -> None:
+        self.status_counts = status_counts
 
     def calculate_score(self) -> int:
         """Calculate score from 0-100."""
-        score = 100
-
-        for result in self.results:
-            if result.status == "critical":
-                score -= 20
-            elif result.status == "warning":
-                score -= 10
-            elif result.status == "suggestion":
-                score -= 5
-
+        counts = self.status_counts
+        score = 100 - sum(
+            penalty * counts.get(status, 0) for status, penalty in STATUS_PENALTIES.items()
+        )
         return max(0, score)
 
     def get_grade(self) -> str:
@@ -959,164 +1321,207 @@ class SkillScorer:
             return "F"
 
 
+def bucket_by_status(results: List[ValidationResult]) -> Dict[str, List[ValidationResult]]:
+    """Group results by status in one pass, keeping their original order."""
+    by_status: Dict[str, List[ValidationResult]] = defaultdict(list)
+    for result in results:
+        by_status[result.status].append(result)
+    return by_status
+
+
+def overall_status(critical: int, warnings: int) -> str:
+    """Overall status from the critical and warning counts."""
+    return "fail" if critical else ("warn" if warnings else "pass")
+
+
+class SkillSummary(NamedTuple):
+    """Status buckets and headline figures for one skill's results."""
+
+    by_status: Dict[str, List[ValidationResult]]
+    score: int
+    grade: str
+    critical: int
+    warnings: int
+    suggestions: int
+    overall: str
+
+
+def summarize(results: List[ValidationResult]) -> SkillSummary:
+    """Bucket results by status once and derive the score, grade and counts."""
+    by_status = bucket_by_status(results)
+    scorer = SkillScorer({status: len(bucket) for status, bucket in by_status.items()})
+    critical = len(by_status["critical"])
+    warnings = len(by_status["warning"])
+    return SkillSummary(
+        by_status,
+        scorer.calculate_score(),
+        scorer.get_grade(),
+        critical,
+        warnings,
+        len(by_status["suggestion"]),
+        overall_status(critical, warnings),
+    )
+
+
 # =============================================================================
 # REPORT GENERATION
 # =============================================================================
 
+# Icons for overall statuses and result statuses in the Markdown report
+STATUS_EMOJI = {
+    "pass": "✅",
+    "warn": "⚠️",
+    "fail": "❌",
+    "critical": "❌",
+    "warning": "⚠️",
+    "suggestion": "ℹ️",
+    "info": "💡",
+}
+
+# Icons for the overall status in the terminal summary
+OVERALL_EMOJI = {"pass": "✅", "warn": "⚠️", "fail": "❌"}
+
+# Report sections, in order
+CATEGORY_TITLES = {
+    "naming": "1. Naming Convention",
+    "structure": "2. Directory Structure",
+    "yaml": "3. YAML Frontmatter",
+    "content": "4. Content Quality",
+    "references": "5. References",
+    "scripts": "6. Scripts",
+    "ai-analysis": "7. AI Semantic Analysis",
+}
+
+
 def generate_markdown_report(
     skill_path: Path,
     skill_name: str,
     results: List[ValidationResult],
     report_path: Path,
     duration: float,
+    run_time: Optional[datetime] = None,
+    summary: Optional[SkillSummary] = None,
 ) -> None:
-    """Generate detailed Markdown report."""
-
-    status_emoji = {
-        "pass": "✅",
-        "warn": "⚠️",
-        "fail": "❌",
-        "critical": "❌",
-        "warning": "⚠️",
-        "suggestion": "ℹ️",
-        "info": "💡",
-    }
-
-    # Calculate summary
-    scorer = SkillScorer(results)
-    score = scorer.calculate_score()
-    grade = scorer.get_grade()
-    critical = sum(1 for r in results if r.status == "critical")
-    warnings = sum(1 for r in results if r.status == "warning")
-    suggestions = sum(1 for r in results if r.status == "suggestion")
-
-    # Determine overall status
-    if critical > 0:
-        overall_status = "fail"
-    elif warnings > 0:
-        overall_status = "warn"
-    else:
-        overall_status = "pass"
-
-    # Start report
-    lines = [
-        f"# Skill Test Report: {skill_name}",
-        "",
-        f"**Test Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"**Skill Path**: `{skill_path}`",
-        f"**Test Duration**: {duration:.2f} seconds",
-        "",
-        "## Executive Summary",
-        "",
-        f"| Metric | Value |",
-        f"|--------|-------|",
-        f"| **Overall Status** | {status_emoji.get(overall_status, '?')} {overall_status.upper()} |",
-        f"| **Quality Score** | {score}/100 ({grade}) |",
-        f"| **Critical Issues** | {critical} |",
-        f"| **Warnings** | {warnings} |",
-        f"| **Suggestions** | {suggestions} |",
-        "",
-        "---",
-        "",
-    ]
-
-    # Group results by category
-    categories: Dict[str, List[ValidationResult]] = {}
+    """Generate detailed Markdown report.
+
+    Pass the caller's summarize(results) as summary to reuse its buckets.
+    """
+    if run_time is None:
+        run_time = datetime.now()
+    if summary is None:
+        summary = summarize(results)
+    score, grade = summary.score, summary.grade
+    critical, warnings, suggestions = summary.critical, summary.warnings, summary.suggestions
+    overall = summary.overall
+    critical_issues = summary.by_status["critical"]
+    warning_issues = summary.by_status["warning"]
+
+    # Group results by category, keeping their original order
+    categories: Dict[str, List[ValidationResult]] = defaultdict(list)
     for result in results:
-        if result.category not in categories:
-            categories[result.category] = []
         categories[result.category].append(result)
 
-    # Category titles
-    category_titles = {
-        "naming": "1. Naming Convention",
-        "structure": "2. Directory Structure",
-        "yaml": "3. YAML Frontmatter",
-        "content": "4. Content Quality",
-        "references": "5. References",
-        "scripts": "6. Scripts",
-        "ai-analysis": "7. AI Semantic Analysis",
-    }
-
-    # Generate sections
-    for cat, title in category_titles.items():
-        if cat not in categories:
-            continue
-
-        lines.append(f"## {title}")
-        lines.append("")
-
-        for result in categories[cat]:
-            icon = status_emoji.get(result.status, "•")
-            status_label = result.status.capitalize()
-
-            lines.append(f"{icon} **{status_label}**: {result.message}")
-
-            if result.details:
-                lines.append(f"  <details><summary>Details</summary>")
-                lines.append(f"  ")
-                lines.append(f"  {result.details}")
-                lines.append(f"  </details>")
+    # Start report
+    report = io.StringIO()
+    report.write(
+        f"# Skill Test Report: {skill_name}\n"
+        "\n"
+        f"**Test Date**: {run_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"**Skill Path**: `{skill_path}`\n"
+        f"**Test Duration**: {duration:.2f} seconds\n"
+        "\n"
+        "## Executive Summary\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| **Overall Status** | {STATUS_EMOJI.get(overall, '?')} {overall.upper()} |\n"
+        f"| **Quality Score** | {score}/100 ({grade}) |\n"
+        f"| **Critical Issues** | {critical} |\n"
+        f"| **Warnings** | {warnings} |\n"
+        f"| **Suggestions** | {suggestions} |\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
 
-            if result.suggestion:
-                lines.append(f"  💡 **Suggestion**: {result.suggestion}")
+    # Known sections in report order, then any other category as first seen
+    sections = [
+        (title, categories[cat]) for cat, title in CATEGORY_TITLES.items() if cat in categories
+    ]
+    sections.extend(
+        (f"Other: {cat}", items) for cat, items in categories.items() if cat not in CATEGORY_TITLES
+    )
 
-            lines.append("")
+    # Generate sections, one write per result
+    emoji = STATUS_EMOJI.get
+    for title, items in sections:
+        report.write(f"## {title}\n\n")
+
+        for result in items:
+            # Read each field once into a local
+            status = result.status
+            details = result.details
+            suggestion = result.suggestion
+            details_block = (
+                f"  <details><summary>Details</summary>\n  \n  {details}\n  </details>\n"
+                if details
+                else ""
+            )
+            suggestion_line = f"  💡 **Suggestion**: {suggestion}\n" if suggestion else ""
+            report.write(
+                f"{emoji(status, '•')} **{status.capitalize()}**: {result.message}\n"
+                f"{details_block}{suggestion_line}\n"
+            )
 
-        lines.append("")
+        report.write("\n")
 
     # Add recommendations
-    critical_issues = [r for r in results if r.status == "critical"]
-    warning_issues = [r for r in results if r.status == "warning"]
-
     if critical_issues or warning_issues:
-        lines.append("## Priority Recommendations")
-        lines.append("")
-        lines.append("### Critical (Must Fix)")
-        lines.append("")
+        report.write("## Priority Recommendations\n\n### Critical (Must Fix)\n\n")
 
         for i, issue in enumerate(critical_issues, 1):
-            lines.append(f"{i}. **{issue.message}**")
-            if issue.suggestion:
-                lines.append(f"   - {issue.suggestion}")
-            lines.append("")
+            suggestion = f"   - {issue.suggestion}\n" if issue.suggestion else ""
+            report.write(f"{i}. **{issue.message}**\n{suggestion}\n")
 
         if warning_issues:
-            lines.append("### Warnings (Should Fix)")
-            lines.append("")
+            report.write("### Warnings (Should Fix)\n\n")
 
             for i, issue in enumerate(warning_issues[:5], 1):  # Top 5 warnings
-                lines.append(f"{i}. **{issue.message}**")
-                if issue.suggestion:
-                    lines.append(f"   - {issue.suggestion}")
-                lines.append("")
+                suggestion = f"   - {issue.suggestion}\n" if issue.suggestion else ""
+                report.write(f"{i}. **{issue.message}**\n{suggestion}\n")
 
-        lines.append("")
+        report.write("\n")
 
     # Conclusion
-    lines.append("## Conclusion")
-    lines.append("")
-
-    if overall_status == "pass":
-        lines.append("✅ **The skill meets all quality standards and is ready for use.**")
-    elif overall_status == "warn":
-        lines.append("⚠️ **The skill has warnings that should be addressed.**")
-        lines.append("")
-        lines.append("The skill is functional but would benefit from the suggested improvements.")
+    if overall == "pass":
+        conclusion = "✅ **The skill meets all quality standards and is ready for use.**\n"
+    elif overall == "warn":
+        conclusion = (
+            "⚠️ **The skill has warnings that should be addressed.**\n"
+            "\n"
+            "The skill is functional but would benefit from the suggested improvements.\n"
+        )
     else:
-        lines.append("❌ **The skill has critical issues that must be resolved.**")
-        lines.append("")
-        lines.append("Please fix all critical issues before using this skill.")
-
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append("*Generated by skill-test*")
+        conclusion = (
+            "❌ **The skill has critical issues that must be resolved.**\n"
+            "\n"
+            "Please fix all critical issues before using this skill.\n"
+        )
+    report.write(
+        "## Conclusion\n"
+        "\n"
+        f"{conclusion}"
+        "\n"
+        "---\n"
+        "\n"
+        "*Generated by skill-test*"
+    )
 
     # Write report
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # Encoded up front and written as bytes: one write, "\n" line endings on
+    # every platform, and no text-mode newline translation.
+    report_path.write_bytes(report.getvalue().encode("utf-8"))
 
 
 # =============================================================================
@@ -1129,40 +1534,43 @@ def generate_ai_metadata(
     results: List[ValidationResult],
     report_path: Path,
     metadata_path: Path,
+    run_time: Optional[datetime] = None,
+    summary: Optional[SkillSummary] = None,
 ) -> None:
-    """Generate AI metadata file for main session analysis."""
+    """Generate AI metadata file for main session analysis.
+
+    Pass the caller's summarize(results) as summary to reuse its counts.
+    """
+    if run_time is None:
+        run_time = datetime.now()
+    if summary is None:
+        summary = summarize(results)
     # Read YAML frontmatter and body preview
     skill_md = skill_path / "SKILL.md"
-    extractor = SkillContentExtractor(skill_md)
+    extractor = get_extractor(skill_md)
 
-    # Extract YAML fields
-    yaml_data = {}
-    for field in REQUIRED_YAML_FIELDS:
-        value = extractor.get_yaml_field(field)
-        if value:
-            yaml_data[field] = value
+    # Select the required YAML fields from the frontmatter parsed at load time
+    all_yaml = extractor.get_yaml_dict()
+    yaml_data = {field: all_yaml[field] for field in REQUIRED_YAML_FIELDS if all_yaml.get(field)}
 
     # Get body preview (first 2000 chars)
-    body_text = "\n".join(extractor.body_lines)
-    body_preview = body_text[:2000]
-
-    # Summarize structural results
-    critical = sum(1 for r in results if r.status == "critical")
-    warnings = sum(1 for r in results if r.status == "warning")
-    suggestions = sum(1 for r in results if r.status == "suggestion")
-
-    # Build issues list
-    issues = [
-        {
-            "category": r.category,
-            "status": r.status,
-            "message": r.message,
-            "details": r.details,
-            "suggestion": r.suggestion,
-        }
-        for r in results
-        if r.status in ("critical", "warning", "suggestion")
-    ]
+    body_preview = extractor.body_prefix(2000)
+
+    # Build issues list, stopping after the top 10
+    issues = list(islice(
+        (
+            {
+                "category": r.category,
+                "status": r.status,
+                "message": r.message,
+                "details": r.details,
+                "suggestion": r.suggestion,
+            }
+            for r in results
+            if r.status in REPORTABLE_STATUSES
+        ),
+        10,
+    ))
 
     # Create metadata dict
     metadata = {
@@ -1172,31 +1580,160 @@ def generate_ai_metadata(
         "body_preview": body_preview,
         "full_body_path": str(skill_md),
         "structural_results": {
-            "critical": critical,
-            "warnings": warnings,
-            "suggestions": suggestions,
-            "issues": issues[:10],  # Top 10 issues
+            "critical": summary.critical,
+            "warnings": summary.warnings,
+            "suggestions": summary.suggestions,
+            "issues": issues,
         },
         "report_path": str(report_path),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": run_time.isoformat(),
     }
 
-    # Write metadata file
+    # Write metadata file. Compact json.dumps runs entirely in the C encoder;
+    # json.dump and indent= both fall back to the pure-Python one.
     metadata_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    metadata_path.write_bytes(
+        json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+# =============================================================================
+# BATCH VALIDATION
+# =============================================================================
+
+def find_skill_dirs(root: Path) -> List[Path]:
+    """Find child directories of root that contain a SKILL.md."""
+    if not root.is_dir():
+        return []
+    # DirEntry caches the file type from readdir, so only SKILL.md is stat'ed
+    with os.scandir(root) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        )
+
+
+def validate_skill_worker(
+    skill_path: Path,
+) -> Tuple[List[ValidationResult], str, float, Optional[str]]:
+    """Run structural validation for one skill in a worker process.
+
+    Returns the results, the captured terminal output, the duration, and the
+    error text if a check raised. A failing skill is recorded with a critical
+    result rather than raised, so it cannot abort the rest of the batch.
+    """
+    start_time = time.time()
+    validator = StructuralValidator(skill_path)
+    error = None
+    try:
+        try:
+            validator.validate_all()
+        except Exception as e:
+            error = "".join(traceback.format_exception_only(type(e), e)).strip()
+            validator.add_result(
+                "validation",
+                "critical",
+                "Validation aborted by an internal error",
+                traceback.format_exc().strip(),
+                suggestion="Fix the cause of the error and re-run skill-test",
+            )
+            print_error(f"Validation aborted: {error}")
+        return validator.get_results(), console.drain(), time.time() - start_time, error
+    finally:
+        # On success the output was drained into the return value; if a check
+        # raised, write the partial progress out before the error propagates
+        console.flush()
+
+
+def run_batch(root: Path, skill_dirs: List[Path], output_dir: Path) -> int:
+    """Validate several skills in parallel and print a combined summary."""
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}Skill Test: {len(skill_dirs)} skills in {root}{Colors.ENDC}")
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    print_phase_header(1, 1, "Structural Validation (Python)")
+    console.flush()
+
+    run_time = datetime.now()
+    timestamp = run_time.strftime("%Y%m%d-%H%M%S")
+    summaries: List[Dict[str, Any]] = []
+    max_workers = min(len(skill_dirs), os.cpu_count() or 1)
+    # Hand skills to workers in chunks so large repositories don't pay one
+    # IPC round trip per skill; ~4 chunks per worker keeps the load balanced.
+    chunksize = max(1, len(skill_dirs) // (max_workers * 4))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = executor.map(validate_skill_worker, skill_dirs, chunksize=chunksize)
+        for skill_dir, (results, output, duration, error) in zip(skill_dirs, outcomes):
+            # One write per skill: its header plus the worker's captured output
+            header = f"\n{Colors.BOLD}{Colors.OKBLUE}>>> {skill_dir.name}{Colors.ENDC}\n"
+            sys.stdout.write(header + output)
+
+            summary = summarize(results)
+            report_path = output_dir / f"skill-test-report-{skill_dir.name}-{timestamp}.md"
+            generate_markdown_report(
+                skill_dir, skill_dir.name, results, report_path, duration, run_time, summary
+            )
+
+            entry: Dict[str, Any] = {
+                "skill_name": skill_dir.name,
+                "status": summary.overall,
+                "score": summary.score,
+                "grade": summary.grade,
+                "report_path": str(report_path),
+                "summary": {
+                    "critical": summary.critical,
+                    "warnings": summary.warnings,
+                    "suggestions": summary.suggestions,
+                },
+            }
+            if error is not None:
+                entry["error"] = error
+            summaries.append(entry)
+
+    # Print combined summary
+    console.write(f"\n{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}Test Completed: {len(skill_dirs)} skills{Colors.ENDC}")
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}\n")
+
+    for entry in summaries:
+        counts = entry["summary"]
+        console.write(
+            f"{OVERALL_EMOJI.get(entry['status'], '?')} {entry['skill_name']}: "
+            f"{entry['score']}/100 ({entry['grade']}) - "
+            f"{counts['critical']} Critical, {counts['warnings']} Warnings, "
+            f"{counts['suggestions']} Suggestions"
+        )
+    console.write()
+
+    statuses = {entry["status"] for entry in summaries}
+    if "fail" in statuses:
+        overall = "fail"
+    elif "warn" in statuses:
+        overall = "warn"
+    else:
+        overall = "pass"
+
+    console.write(f"SKILL_TEST_JSON::{json.dumps({'status': overall, 'skills': summaries})}")
+    console.flush()
+
+    return 0 if overall != "fail" else 1
 
 
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
-def main():
+def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Test and validate Claude Skills (Hybrid: Structural + AI Analysis)"
     )
-    parser.add_argument("skill_path", type=Path, help="Path to the skill directory")
+    parser.add_argument(
+        "skill_path",
+        type=Path,
+        help="Path to the skill directory (or a directory of skills)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -1220,49 +1757,66 @@ def main():
     # Validate input path
     if not args.skill_path.exists():
         print_error(f"Skill path not found: {args.skill_path}")
+        console.flush()
         sys.exit(1)
 
     if not (args.skill_path / "SKILL.md").exists():
-        print_error(f"SKILL.md not found in: {args.skill_path}")
-        sys.exit(1)
+        skill_dirs = find_skill_dirs(args.skill_path)
+        if not skill_dirs:
+            print_error(f"SKILL.md not found in: {args.skill_path}")
+            console.flush()
+            sys.exit(1)
+        if args.ai_metadata:
+            parser.error("--ai-metadata needs a single skill directory, not a directory of skills")
+        sys.exit(run_batch(args.skill_path, skill_dirs, args.output_dir))
 
-    import time
     start_time = time.time()
 
-    print(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}Skill Test: {args.skill_path.name}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
-
-    # Phase 1: Structural Validation
-    print_phase_header(1, 2, "Structural Validation (Python)")
-
-    structural_validator = StructuralValidator(args.skill_path)
-    structural_validator.validate_all()
-    structural_results = structural_validator.get_results()
-
-    # Phase 2: AI Semantic Analysis
-    all_results = structural_results.copy()
-
-    if not args.no_ai:
-        print_phase_header(2, 2, "AI Semantic Analysis")
-        ai_analyzer = AISemanticAnalyzer(args.skill_path)
-        ai_analyzer.analyze_all()
-        ai_results = ai_analyzer.get_results()
-        all_results.extend(ai_results)
-
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}Skill Test: {args.skill_path.name}{Colors.ENDC}")
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
+
+    try:
+        # Phase 1: Structural Validation
+        print_phase_header(1, 2, "Structural Validation (Python)")
+
+        structural_validator = StructuralValidator(args.skill_path)
+        structural_validator.validate_all()
+
+        # Phase 2: AI Semantic Analysis. The validator is done with its result
+        # list, so AI results are appended to it in place rather than to a copy.
+        all_results = structural_validator.get_results()
+
+        if not args.no_ai:
+            print_phase_header(2, 2, "AI Semantic Analysis")
+            ai_analyzer = AISemanticAnalyzer(args.skill_path)
+            ai_analyzer.analyze_all()
+            all_results.extend(ai_analyzer.get_results())
+    finally:
+        # Show the queued progress even if a check raised mid-phase
+        console.flush()
     duration = time.time() - start_time
 
     # Generate report
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    run_time = datetime.now()
+    timestamp = run_time.strftime("%Y%m%d-%H%M%S")
     report_filename = f"skill-test-report-{args.skill_path.name}-{timestamp}.md"
     report_path = args.output_dir / report_filename
 
+    # Calculate summary once; the report and metadata reuse its buckets
+    summary = summarize(all_results)
+    by_status = summary.by_status
+    score, grade, overall = summary.score, summary.grade, summary.overall
+    critical, warnings, suggestions = summary.critical, summary.warnings, summary.suggestions
+
     generate_markdown_report(
         args.skill_path,
         args.skill_path.name,
         all_results,
         report_path,
         duration,
+        run_time,
+        summary,
     )
 
     # Generate AI metadata if requested
@@ -1275,43 +1829,27 @@ def main():
             all_results,
             report_path,
             ai_metadata_path,
+            run_time,
+            summary,
         )
 
-    # Calculate summary
-    scorer = SkillScorer(all_results)
-    score = scorer.calculate_score()
-    grade = scorer.get_grade()
-    critical = sum(1 for r in all_results if r.status == "critical")
-    warnings = sum(1 for r in all_results if r.status == "warning")
-    suggestions = sum(1 for r in all_results if r.status == "suggestion")
-
-    if critical > 0:
-        overall = "fail"
-    elif warnings > 0:
-        overall = "warn"
-    else:
-        overall = "pass"
-
     # Print terminal summary
-    print(f"\n{Colors.HEADER}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}Test Completed: {args.skill_path.name}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
-
-    status_emoji = {"pass": "✅", "warn": "⚠️", "fail": "❌"}
-
-    print(f"\n{status_emoji.get(overall, '?')} Status: {overall.upper()}")
-    print(f"📊 Score: {score}/100 ({grade})")
-    print(f"📋 Issues: {critical} Critical, {warnings} Warnings, {suggestions} Suggestions")
-    print(f"📁 Report: [{report_filename}](file:///{report_path.as_posix()})")
-
-    if critical > 0 or warnings > 0:
-        print(f"\n{Colors.BOLD}Top Issues:{Colors.ENDC}")
-        for r in all_results[:5]:
-            if r.status in ("critical", "warning"):
-                icon = status_emoji.get(r.status, "•")
-                print(f"  {icon} {r.message}")
-
-    print()
+    console.write(f"\n{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"{Colors.BOLD}Test Completed: {args.skill_path.name}{Colors.ENDC}")
+    console.write(f"{Colors.HEADER}{'='*60}{Colors.ENDC}")
+    console.write(f"\n{OVERALL_EMOJI.get(overall, '?')} Status: {overall.upper()}")
+    console.write(f"📊 Score: {score}/100 ({grade})")
+    console.write(f"📋 Issues: {critical} Critical, {warnings} Warnings, {suggestions} Suggestions")
+    console.write(f"📁 Report: [{report_filename}](file:///{report_path.as_posix()})")
+
+    # Critical issues first, then warnings; shared by the terminal and JSON
+    top_issues = [r.message for r in (by_status["critical"] + by_status["warning"])[:5]]
+    if top_issues:
+        console.write(f"\n{Colors.BOLD}Top Issues:{Colors.ENDC}")
+        for message in top_issues:
+            console.write(f"  • {message}")
+
+    console.write()
 
     # Output JSON for machine parsing
     json_output = {
@@ -1324,14 +1862,15 @@ def main():
             "warnings": warnings,
             "suggestions": suggestions,
         },
-        "top_issues": [r.message for r in all_results if r.status in ("critical", "warning")][:5],
+        "top_issues": top_issues,
     }
 
-    print(f"SKILL_TEST_JSON::{json.dumps(json_output)}")
+    console.write(f"SKILL_TEST_JSON::{json.dumps(json_output)}")
 
     # Output AI metadata marker if generated
     if ai_metadata_path:
-        print(f"SKILL_TEST_AI_METADATA::{ai_metadata_path.as_posix()}")
+        console.write(f"SKILL_TEST_AI_METADATA::{ai_metadata_path.as_posix()}")
+    console.flush()
 
     sys.exit(0 if overall != "fail" else 1)
 